@@ -1,5 +1,6 @@
 import pandas as pd
-import os
+import numpy as np
+import csv
 
 impact_columns = [
     "Infrastructural impact", 
@@ -10,76 +11,102 @@ impact_columns = [
     "Human health impact"
 ]
 groupby=["Date","Time_Period"]
-gold_data = pd.read_csv("the_path_to_gold_data.csv")
+
+def read_table(path):
+    return pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+
+gold_data = read_table("the_path_to_gold_data.csv")
 gold_data.columns = [x.capitalize() for x in gold_data.columns]
 
-def eval_row_wise_acc(data, output_file):
+def label_array(frame):
+    # Missing labels (e.g. a category the model left out) are kept out of every count via the mask
+    values = frame.to_numpy(np.float64)
+    valid = ~np.isnan(values)
+    if not np.isin(values[valid], (0, 1)).all():
+        raise ValueError("impact labels must be 0, 1 or empty")
+    return np.where(valid, values, 0).astype(np.int8), valid
+
+GOLD_GROUPED = gold_data.groupby(groupby)[impact_columns].max()
+GOLD_GROUPED_NP, GOLD_VALID = label_array(GOLD_GROUPED)
+GOLD_INDEX = GOLD_GROUPED.index
+IMPACT_BITS = (1 << np.arange(len(impact_columns))).astype(np.uint8)
+
+def pack_impacts(labels):
+    return (labels * IMPACT_BITS).sum(1, dtype=np.uint8)
+
+def append_results(output_file, results):
+    if not results:
+        return
+    with open(output_file, "a", newline="", buffering=1 << 20) as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]), lineterminator="\n")
+        if f.tell() == 0:
+            writer.writeheader()
+        writer.writerows(results)
+
+def group_with_gold(data):
+    # Both evaluators accept this result, so a frame evaluated twice is only grouped once;
+    # regroup after editing the frame
     data.columns = [x.capitalize() for x in data.columns]
-    models = data['Model_type'].unique()
+    all_grouped = data.groupby(["Model_type"] + groupby)[impact_columns].max()
+    pos = GOLD_INDEX.get_indexer(all_grouped.index.droplevel("Model_type"))
+    keep = pos >= 0
+    model_level = all_grouped.index.get_level_values("Model_type")[keep]
+    m, valid = label_array(all_grouped[keep])
+    g = GOLD_GROUPED_NP[pos[keep]]
+    valid &= GOLD_VALID[pos[keep]]
+    return model_level, m, g, valid
 
-    gold_grouped = gold_data.groupby(groupby)[impact_columns].max()
-    results = []
+def eval_row_wise_acc(data, output_file, grouped=None):
+    data.columns = [x.capitalize() for x in data.columns]
+    model_level, m, g, valid = grouped if grouped is not None else group_with_gold(data)
+    models = data['Model_type'].unique()
 
-    for model in models:
-        model_data = data[data['Model_type'] == model]
-        grouped = model_data.groupby(groupby)[impact_columns].max()
-        merged = grouped.join(gold_grouped, how='inner', lsuffix='_model', rsuffix='_gold')
+    # A row with a missing label is never correct
+    all_correct = (pack_impacts(m) == pack_impacts(g)) & valid.all(axis=1)
+    accuracy = pd.Series(all_correct).groupby(model_level).mean().reindex(models, fill_value=0)
 
-        all_correct = (merged[[f"{col}_model" for col in impact_columns]].values ==
-                       merged[[f"{col}_gold" for col in impact_columns]].values).all(axis=1)
+    results = [{
+        "Model_Type": model,
+        "Row-Wise-Accuracy": round(value, 4)
+    } for model, value in accuracy.items()]
 
-        accuracy = all_correct.sum() / len(all_correct) if len(all_correct) > 0 else 0
-        results.append({
-            "Model_Type": model,
-            "Row-Wise-Accuracy": round(accuracy, 4)
-        })
+    append_results(output_file, results)
 
-    df_result = pd.DataFrame(results)
-    if not os.path.isfile(output_file):
-        df_result.to_csv(output_file, index=False)
-    else:
-        df_result.to_csv(output_file, mode='a', header=False, index=False)
+def confusion_metrics(tn, fn, fp, tp):
+    precision = np.divide(tp, tp + fp, out=np.zeros(tp.shape), where=(tp + fp) > 0)
+    recall = np.divide(tp, tp + fn, out=np.zeros(tp.shape), where=(tp + fn) > 0)
+    f1 = np.divide(2 * precision * recall, precision + recall,
+                   out=np.zeros(tp.shape), where=(precision + recall) > 0)
+    total = tp + tn + fp + fn
+    accuracy = np.divide(tp + tn, total, out=np.zeros(tp.shape), where=total > 0)
+    return {"Precision": precision, "Recall": recall, "F1": f1, "Accuracy": accuracy}
 
-def eval_metrics(data, output_file):
+def eval_metrics(data, output_file, grouped=None):
     data.columns = [x.capitalize() for x in data.columns]
+    model_level, m, g, valid = grouped if grouped is not None else group_with_gold(data)
     models = data["Model_type"].unique()
-    gold_grouped = gold_data.groupby(groupby)[impact_columns].max()
-    results = []
 
-    for model in models:
-        model_data = data[data["Model_type"] == model]
-        grouped = model_data.groupby(groupby)[impact_columns].max()
-        merged = grouped.join(gold_grouped, how="inner", lsuffix="_model", rsuffix="_gold")
+    # One bincount over (model, column, model label, gold label) codes gives every 2x2 confusion matrix
+    n_cols = len(impact_columns)
+    model_idx = pd.Index(models).get_indexer(model_level)
+    codes = (model_idx[:, None] * n_cols + np.arange(n_cols)) * 4 + m * 2 + g
+    counts = np.bincount(codes[valid], minlength=len(models) * n_cols * 4).reshape(len(models), n_cols, 4)
+    tn, fn, fp, tp = counts[..., 0], counts[..., 1], counts[..., 2], counts[..., 3]
 
-        for metric_name in ["Precision", "Recall", "F1", "Accuracy"]:
-            metrics = {"Model_Type": model, "Metric": metric_name}
-            for col in impact_columns:
-                tp = ((merged[f"{col}_model"] == 1) & (merged[f"{col}_gold"] == 1)).sum()
-                tn = ((merged[f"{col}_model"] == 0) & (merged[f"{col}_gold"] == 0)).sum()
-                fp = ((merged[f"{col}_model"] == 1) & (merged[f"{col}_gold"] == 0)).sum()
-                fn = ((merged[f"{col}_model"] == 0) & (merged[f"{col}_gold"] == 1)).sum()
-
-                if metric_name == "Precision":
-                    value = tp / (tp + fp) if (tp + fp) > 0 else 0
-                elif metric_name == "Recall":
-                    value = tp / (tp + fn) if (tp + fn) > 0 else 0
-                elif metric_name == "F1":
-                    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-                    recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-                    value = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
-                elif metric_name == "Accuracy":
-                    value = (tp + tn) / (tp + tn + fp + fn) if (tp + tn + fp + fn) > 0 else 0
+    metric_values = confusion_metrics(tn, fn, fp, tp)
 
+    results = []
+    for i, model in enumerate(models):
+        for metric_name, values in metric_values.items():
+            metrics = {"Model_Type": model, "Metric": metric_name}
+            for col, value in zip(impact_columns, values[i]):
                 metrics[col] = round(value, 4)
             results.append(metrics)
 
-    df_result = pd.DataFrame(results)
-    print(df_result)
+    print(pd.DataFrame(results))
 
-    if not os.path.isfile(output_file):
-        df_result.to_csv(output_file, index=False)
-    else:
-        df_result.to_csv(output_file, mode="a", header=False, index=False)
+    append_results(output_file, results)
 
-data = pd.read_csv("/content/output_gpt.csv")
-eval_metrics(data, "accuracy_results.csv")
\ No newline at end of file
+data = read_table("/content/output_gpt.csv")
+grouped = group_with_gold(data)
+eval_metrics(data, "accuracy_results.csv", grouped)
\ No newline at end of file
@@ -1,76 +1,87 @@
 import pandas as pd
-from openai import OpenAI
+import numpy as np
+from openai import AsyncOpenAI
 import os
 import dotenv
-import time
-from tqdm import tqdm
+import asyncio
+from tqdm.asyncio import tqdm_asyncio
 
 dotenv.load_dotenv()
 
-client = OpenAI(
+client = AsyncOpenAI(
     api_key=os.environ.get("OPENAI_API_KEY")
 )
-def create_prompt(row):
-    impacts = []
-    if row['Infrastructural Impact'] > 0:
-        impacts.append('infrastructure')
-    if row['Political Impact'] > 0:
-        impacts.append('political')
-    if row['Financial Impact'] > 0:
-        impacts.append('financial')
-    if row['Ecological Impact'] > 0:
-        impacts.append('ecological')
-    if row['Agricultural Impact'] > 0:
-        impacts.append('agricultural')
-    if row['Human Health Impact'] > 0:
-        impacts.append('human health')
-    
-    impact_str = ', '.join(impacts) if impacts else 'general'
-    
-    prompt = f"""Given the following passage about {row['Weather']}, generate a specific question that:
+MAX_CONCURRENT_REQUESTS = 20
+
+# Impact columns and the label each one contributes to the prompt
+IMPACT_LABELS = {
+    'Infrastructural Impact': 'infrastructure',
+    'Political Impact': 'political',
+    'Financial Impact': 'financial',
+    'Ecological Impact': 'ecological',
+    'Agricultural Impact': 'agricultural',
+    'Human Health Impact': 'human health',
+}
+
+def impact_strings(df):
+    """Build the impact description of every row at once from the impact columns."""
+    labels = np.array(list(IMPACT_LABELS.values()))
+    mask = df[list(IMPACT_LABELS)].to_numpy() > 0
+    return [', '.join(labels[m]) if m.any() else 'general' for m in mask]
+
+def create_prompt(row, impact_str):
+    """Build the prompt for a row yielded by DataFrame.itertuples."""
+    prompt = f"""Given the following passage about {row.Weather}, generate a specific question that:
     1. Can be answered using ONLY the information in this passage
     2. Focuses on the {impact_str} impacts mentioned
     3. Is detailed and specific to this exact situation
     4. Requires understanding the passage's unique context
-    5. Cannot be answered by other similar passages about {row['Weather']}
+    5. Cannot be answered by other similar passages about {row.Weather}
 
     Passage:
-    {row['Text']}
+    {row.Text}
 
     Generate a single, focused question that meets these criteria."""
 
     return prompt
 
-def generate_query(prompt, max_retries=3):
+async def generate_query(prompt, semaphore, max_retries=3):
     """Generate a query using GPT-4 with retry logic."""
-    for attempt in range(max_retries):
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that generates specific, focused questions about weather-related passages. Your questions should be answerable using only the information in the given passage."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=400
-            )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            if attempt == max_retries - 1:
-                print(f"Error after {max_retries} attempts: {e}")
-                return "Error generating query"
-            time.sleep(5)
+    async with semaphore:
+        for attempt in range(max_retries):
+            try:
+                response = await client.chat.completions.create(
+                    model="gpt-4o",
+                    messages=[
+                        {"role": "system", "content": "You are a helpful assistant that generates specific, focused questions about weather-related passages. Your questions should be answerable using only the information in the given passage."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=400
+                )
+                return response.choices[0].message.content.strip()
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    print(f"Error after {max_retries} attempts: {e}")
+                    return "Error generating query"
+                # Exponential backoff, e.g. when rate limited
+                await asyncio.sleep(2 ** attempt)
+
+async def generate_queries(df, todo):
+    """Generate queries for the rows selected by the boolean mask todo, at most MAX_CONCURRENT_REQUESTS at a time."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    prompts = [create_prompt(row, impact_str)
+               for row, impact_str, selected in zip(df.itertuples(index=False), impact_strings(df), todo)
+               if selected]
+    return await tqdm_asyncio.gather(*[generate_query(prompt, semaphore) for prompt in prompts])
 
 
 df = pd.read_csv('datasets/context_data/reranking_passage.csv')
-df['Generated_Query'] = ''
-for idx in tqdm(df.index):
-    if df.loc[idx, 'Remove'] == 0:  
-        prompt = create_prompt(df.loc[idx])
-        query = generate_query(prompt)
-        df.loc[idx, 'Generated_Query'] = query
-        time.sleep(1) 
+todo = df['Remove'].eq(0).to_numpy()
+queries = [''] * len(df)
+for i, query in zip(todo.nonzero()[0], asyncio.run(generate_queries(df, todo))):
+    queries[i] = query
+df['Generated_Query'] = queries
 output_file = 'reranking_passage_with_queries.csv'
 df.to_csv(output_file, index=False)
 print(f"Results saved to {output_file}")
-
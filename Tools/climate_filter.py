@@ -13,18 +13,58 @@ Usage:
 
     # Custom input/output:
     python climate_filter.py --input input.csv --output-climate climate.csv --output-no-climate no_climate.csv
+
+    # Parquet outputs for pandas consumers (needs pyarrow; ~5-10x less I/O than CSV):
+    python climate_filter.py --historical --parquet
 """
 
 import csv
 import argparse
+import hashlib
 import os
 import re
 import sys
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from contextlib import ExitStack
+import multiprocessing
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    # Optional: only needed for --arrow and --parquet
+    pa = pacsv = pq = None
+
+try:
+    import numpy as np
+    from numba import njit, prange, set_num_threads
+except ImportError:
+    # Optional: without numba every row goes straight to the regex scan
+    njit = None
 
 # Increase CSV field size limit to handle large text fields
 csv.field_size_limit(sys.maxsize)
 
+# Buffer size for the input and output files (the 8 KiB default costs many more read/write syscalls)
+IO_BUFFER_SIZE = 1 << 20
+
+# Rows handed to a worker process at a time
+CHUNK_SIZE = 10000
+
+# Number of recently seen texts whose classification is remembered (per process)
+MATCH_CACHE_SIZE = 131072
+
+# Block size for pyarrow's CSV reader (must hold the largest single row)
+ARROW_BLOCK_SIZE = 1 << 22
+
+# Candidate names of the column holding the article text, in priority order
+TEXT_COLUMNS = ['Text', 'text', 'content', 'body', 'ocr_text', 'article']
+
+# Columns of the match summary written in mock mode
+MOCK_CLIMATE_FIELDS = ["RowNumber", "Date", "MatchedKeyword", "MatchType", "Context"]
+MOCK_NO_CLIMATE_FIELDS = ["RowNumber", "Date", "Preview"]
+
 
 # Climate-related keyword sets (O(1) lookup)
 # Only include words that are CLEARLY climate-related to avoid false positives
@@ -69,42 +109,118 @@ CLIMATE_KEYWORDS = {
     'sea ice', 'seaice',
 }
 
-# Multi-word patterns (regex)
-CLIMATE_PATTERNS = [
-    r'\bclimate change\b',
-    r'\bglobal warming\b',
-    r'\bsea level\b',
-    r'\bsea level rise\b',
-    r'\bcarbon dioxide\b',
-    r'\bgreenhouse gas\b',
-    r'\bgreenhouse gases\b',
-    r'\bextreme weather\b',
-    r'\bheat wave\b',
-    r'\bcarbon emission\b',
-    r'\bfossil fuel\b',
-    r'\bfossil fuels\b',
-    r'\brenewable energy\b',
-    r'\bclean energy\b',
-    r'\bnet zero\b',
-    r'\bclimate crisis\b',
-    r'\bclimate emergency\b',
-    r'\bclimate action\b',
-    r'\bclimate policy\b',
-    r'\bparis agreement\b',
-    r'\bice sheet\b',
-    r'\bpermafrost\b',
-    r'\bcarbon footprint\b',
-    r'\bclimate impact\b',
-    r'\bclimate science\b',
-    r'\bclimate scientist\b',
-    r'\bwarming climate\b',
-    r'\bglobal climate\b',
-    r'\bacidification\b',
-    r'\bcarbon neutral\b',
-    r'\bzero emission\b',
-    r'\bzero emissions\b',
+# Multi-word phrases, matched as whole words (plain text, not regex)
+CLIMATE_PHRASES = [
+    'climate change',
+    'global warming',
+    'sea level',
+    'sea level rise',
+    'carbon dioxide',
+    'greenhouse gas',
+    'greenhouse gases',
+    'extreme weather',
+    'heat wave',
+    'carbon emission',
+    'fossil fuel',
+    'fossil fuels',
+    'renewable energy',
+    'clean energy',
+    'net zero',
+    'climate crisis',
+    'climate emergency',
+    'climate action',
+    'climate policy',
+    'paris agreement',
+    'ice sheet',
+    'permafrost',
+    'carbon footprint',
+    'climate impact',
+    'climate science',
+    'climate scientist',
+    'warming climate',
+    'global climate',
+    'acidification',
+    'carbon neutral',
+    'zero emission',
+    'zero emissions',
 ]
 
+# Regex patterns built from the phrases
+CLIMATE_PATTERNS = [r'\b' + re.escape(phrase) + r'\b' for phrase in CLIMATE_PHRASES]
+
+# Single-word keywords and multi-word patterns compiled into one alternation each,
+# so every row is scanned once per group instead of once per keyword.
+# Longer alternatives come first so e.g. 'flooded' wins over 'flood'.
+KEYWORD_REGEX = re.compile(
+    r'\b(?:' + '|'.join(re.escape(k) for k in sorted(
+        (k for k in CLIMATE_KEYWORDS if ' ' not in k), key=len, reverse=True)) + r')\b'
+)
+PATTERN_REGEX = re.compile('|'.join(CLIMATE_PATTERNS))
+
+# Plain strings behind every keyword and pattern, for the byte-level prefilter.
+# Built from the literal phrase list, so it stays a superset of PATTERN_REGEX.
+PREFILTER_LITERALS = sorted(
+    {k for k in CLIMATE_KEYWORDS if ' ' not in k} | set(CLIMATE_PHRASES)
+)
+
+
+def make_ac_tables(words):
+    """Build a byte-level Aho-Corasick automaton as dense NumPy tables.
+
+    Returns (goto, output): goto[state, byte] is the next state with the
+    failure transitions already folded in, output[state] is True when some
+    word ends in that state.
+    """
+    goto = [[-1] * 256]
+    output = [False]
+    for word in words:
+        state = 0
+        for byte in word.encode('utf-8'):
+            if goto[state][byte] == -1:
+                goto[state][byte] = len(goto)
+                goto.append([-1] * 256)
+                output.append(False)
+            state = goto[state][byte]
+        output[state] = True
+
+    # Breadth-first pass filling in the failure transitions
+    fail = [0] * len(goto)
+    queue = deque()
+    for byte in range(256):
+        if goto[0][byte] == -1:
+            goto[0][byte] = 0
+        else:
+            queue.append(goto[0][byte])
+    while queue:
+        state = queue.popleft()
+        output[state] = output[state] or output[fail[state]]
+        for byte in range(256):
+            child = goto[state][byte]
+            if child == -1:
+                goto[state][byte] = goto[fail[state]][byte]
+            else:
+                fail[child] = goto[fail[state]][byte]
+                queue.append(child)
+
+    return np.array(goto, dtype=np.int32), np.array(output, dtype=np.bool_)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def scan_candidates(buf, offsets, goto, output):
+        """Flag each text buf[offsets[i]:offsets[i + 1]] that contains any automaton word"""
+        hits = np.zeros(len(offsets) - 1, np.bool_)
+        for i in prange(len(offsets) - 1):
+            state = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                state = goto[state, buf[j]]
+                if output[state]:
+                    hits[i] = True
+                    break
+        return hits
+
+    AC_GOTO, AC_OUTPUT = make_ac_tables(PREFILTER_LITERALS)
+
 
 def normalize_text(text):
     """Normalize text for matching (lowercase, remove special chars)"""
@@ -113,180 +229,359 @@ def normalize_text(text):
     return text.lower()
 
 
-def find_matches(text, keywords_set, patterns):
+def find_matches(text, keyword_regex, pattern_regex):
     """Find all climate-related keyword/pattern matches in text"""
     text_lower = normalize_text(text)
     found_keywords = []
     found_patterns = []
 
-    # Check single keywords with word boundaries
-    for keyword in keywords_set:
-        # Skip multi-word keywords in set (handle those in patterns)
-        if ' ' in keyword:
-            continue
-        # Use word boundary matching to avoid partial matches
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        if re.search(pattern, text_lower):
-            match = re.search(pattern, text_lower)
+    # Single keywords (multi-word keywords are handled by the patterns);
+    # keep the first position of each distinct keyword
+    seen = set()
+    for match in keyword_regex.finditer(text_lower):
+        keyword = match.group(0)
+        if keyword not in seen:
+            seen.add(keyword)
             found_keywords.append((keyword, match.start()))
 
-    # Check regex patterns
-    for pattern in patterns:
-        matches = re.finditer(pattern, text_lower)
-        for match in matches:
-            found_patterns.append(match.group(0))
+    # Multi-word patterns
+    for match in pattern_regex.finditer(text_lower):
+        found_patterns.append((match.group(0), match.start()))
 
     return found_keywords, found_patterns
 
 
-def get_context(text, position, window=5):
-    """Get context around a match (window words left and right)"""
+def candidate_mask(texts):
+    """Flag texts containing any keyword/pattern string, or None without numba.
+
+    Word boundaries are not checked, so this is a superset of the regex
+    matches: rows it rules out can skip the regex scan entirely.
+    """
+    if njit is None:
+        return None
+
+    encoded = [normalize_text(text).encode('utf-8', errors='ignore') for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return scan_candidates(buf, offsets, AC_GOTO, AC_OUTPUT)
+
+
+def has_match(text, keyword_regex, pattern_regex):
+    """Return (matched, position, match_type) for the first climate hit, or None.
+
+    Stops at the first keyword hit; patterns are only scanned when no single
+    keyword matched, mirroring the keyword-first preference of the report.
+    """
+    text_lower = normalize_text(text)
+
+    match = keyword_regex.search(text_lower)
+    if match:
+        return match.group(0), match.start(), 'keyword'
+
+    match = pattern_regex.search(text_lower)
+    if match:
+        return match.group(0), match.start(), 'pattern'
+
+    return None
+
+
+def get_context(text, position, window=5, window_chars=200):
+    """Get context around a match (window words left and right)
+
+    Only the window_chars characters on either side of position are split,
+    so the cost does not grow with the length of the text.
+    """
     if not text:
         return ""
 
-    # Find word boundaries around position
-    words = text.split()
-    text_lower = text.lower()
-
-    # Find which word contains this position
-    current_pos = 0
-    word_idx = -1
-    for i, word in enumerate(words):
-        word_start = text_lower.find(word.lower(), current_pos)
-        word_end = word_start + len(word)
-        if word_start <= position < word_end:
-            word_idx = i
-            break
-        current_pos = word_end
+    start = max(0, position - window_chars)
+    end = min(len(text), position + window_chars)
+    left = text[start:position].split()
+    right = text[position:end].split()
 
-    if word_idx == -1:
-        return " ".join(words[:10])
+    # Drop words cut in half by the slice edges
+    if left and start > 0 and not text[start - 1].isspace():
+        left = left[1:]
+    if right and end < len(text) and not text[end].isspace():
+        right = right[:-1]
 
-    # Get context window
-    start = max(0, word_idx - window)
-    end = min(len(words), word_idx + window + 1)
+    if not right:
+        return " ".join(left[-window:])
 
-    return " ".join(words[start:end])
+    # The match may start in the middle of a word (e.g. '(co2')
+    word = right[0]
+    if left and position > 0 and not text[position - 1].isspace():
+        word = left.pop() + word
 
+    return " ".join(left[-window:] + [word] + right[1:window + 1])
 
-def process_csv(input_file, output_climate, output_no_climate, mock=False, sample=None):
-    """Process CSV and filter rows by climate relevance"""
 
-    climate_count = 0
-    no_climate_count = 0
-    matches_report = []
+# Column layout and options of the current run, set in every worker by init_worker
+_worker_config = {}
 
-    # Initialize output files if not mock
-    climate_rows = []
-    no_climate_rows = []
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
+# LRU cache of has_match results keyed by text digest, for reprinted/duplicate articles
+_match_cache = OrderedDict()
 
-        row_count = 0
-        for row in reader:
-            row_count += 1
 
-            if sample and row_count > sample:
-                break
+def init_worker(text_idx, date_idx, verbose, cache=True, single_threaded=False):
+    """Store the per-run column layout in the (worker) process"""
+    _worker_config.update(text_idx=text_idx, date_idx=date_idx, verbose=verbose, cache=cache)
+    if single_threaded and njit is not None:
+        # The pool already uses every core
+        set_num_threads(1)
 
-            # Get text field (could be 'Text', 'text', or other)
-            text = None
-            for key in ['Text', 'text', 'content', 'body', 'ocr_text', 'article']:
-                if key in row:
-                    text = row[key]
-                    break
 
-            if text is None:
-                # Try first column if no standard name found
-                text = list(row.values())[0] if row else ""
+def read_chunks(reader, sample=None, chunk_size=CHUNK_SIZE):
+    """Yield (first_row_number, rows) chunks, skipping blank lines"""
+    chunk = []
+    first_row = 1
+    row_count = 0
+    for row in reader:
+        if not row:
+            # Blank line
+            continue
+
+        row_count += 1
 
-            date = row.get('Date', row.get('date', f'Row_{row_count}'))
+        if sample and row_count > sample:
+            break
 
-            # Find matches
-            keywords_found, patterns_found = find_matches(text, CLIMATE_KEYWORDS, CLIMATE_PATTERNS)
+        if not chunk:
+            first_row = row_count
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield first_row, chunk
+            chunk = []
 
-            is_climate = len(keywords_found) > 0 or len(patterns_found) > 0
+    if chunk:
+        yield first_row, chunk
 
-            if is_climate:
-                climate_count += 1
-                if not mock:
-                    climate_rows.append(row)
 
-                # Get context for first match
-                if keywords_found:
-                    keyword, pos = keywords_found[0]
-                    context = get_context(text, pos)
-                    matches_report.append({
-                        'row': row_count,
-                        'date': date,
-                        'type': 'climate',
-                        'match_type': 'keyword',
-                        'matched': keyword,
-                        'context': context
-                    })
-                elif patterns_found:
-                    match = patterns_found[0]
-                    pos = text.lower().find(match)
-                    context = get_context(text, pos)
+def open_arrow_reader(input_file, fieldnames, skipped):
+    """Open pyarrow's multithreaded CSV reader on input_file.
+
+    pyarrow cannot pad rows whose field count differs from the header, so
+    those rows are skipped and their row numbers appended to `skipped`.
+    """
+    def skip_row(row):
+        skipped.append(row.number)
+        return 'skip'
+
+    read_options = pacsv.ReadOptions(block_size=ARROW_BLOCK_SIZE, use_threads=True)
+    parse_options = pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=skip_row)
+    # Keep every column as text so rows are written back exactly as read
+    convert_options = pacsv.ConvertOptions(column_types={name: pa.string() for name in fieldnames})
+
+    return pacsv.open_csv(input_file, read_options=read_options, parse_options=parse_options,
+                          convert_options=convert_options)
+
+
+def read_chunks_arrow(reader, sample=None, chunk_size=CHUNK_SIZE):
+    """Yield (first_row_number, rows) chunks from a pyarrow CSV reader"""
+    row_count = 0
+    for batch in reader:
+        if sample:
+            batch = batch.slice(0, sample - row_count)
+
+        for start in range(0, batch.num_rows, chunk_size):
+            part = batch.slice(start, chunk_size)
+            rows = list(zip(*(column.to_pylist() for column in part.columns)))
+            yield row_count + 1, rows
+            row_count += len(rows)
+
+        if sample and row_count >= sample:
+            break
+
+
+def classify_chunk(chunk):
+    """Classify every row of a chunk.
+
+    Returns one (row_number, row, date, hit, context, preview, all_matches)
+    tuple per row; context is set for climate rows, preview for the others.
+    """
+    first_row, rows = chunk
+    text_idx = _worker_config['text_idx']
+    date_idx = _worker_config['date_idx']
+    verbose = _worker_config['verbose']
+    cache = _worker_config['cache']
+
+    texts = [row[text_idx] if text_idx < len(row) else "" for row in rows]
+    hits = [None] * len(rows)
+
+    # Reuse the result for texts seen before; only the rest are scanned
+    todo = range(len(rows))
+    if cache:
+        keys = [hashlib.blake2b(text.encode('utf-8', errors='ignore'), digest_size=16).digest()
+                for text in texts]
+        todo = []
+        for i, key in enumerate(keys):
+            if key in _match_cache:
+                _match_cache.move_to_end(key)
+                hits[i] = _match_cache[key]
+            else:
+                todo.append(i)
+
+    # Find first match
+    candidates = candidate_mask([texts[i] for i in todo])
+    for j, i in enumerate(todo):
+        if candidates is None or candidates[j]:
+            hits[i] = has_match(texts[i], KEYWORD_REGEX, PATTERN_REGEX)
+        if cache:
+            _match_cache[keys[i]] = hits[i]
+            if len(_match_cache) > MATCH_CACHE_SIZE:
+                _match_cache.popitem(last=False)
+
+    results = []
+    for i, (row, text, hit) in enumerate(zip(rows, texts, hits)):
+        row_count = first_row + i
+        date = row[date_idx] if 0 <= date_idx < len(row) else f'Row_{row_count}'
+
+        context = preview = all_matches = None
+        if hit:
+            # Get context for first match
+            context = get_context(text, hit[1])
+            if verbose:
+                all_matches = find_matches(text, KEYWORD_REGEX, PATTERN_REGEX)
+        else:
+            preview = text[:200]
+
+        results.append((row_count, row, date, hit, context, preview, all_matches))
+
+    return results
+
+
+def classify_chunks(chunks, workers, text_idx, date_idx, verbose, cache):
+    """Yield classify_chunk results in input order, using up to `workers` processes"""
+    if workers <= 1:
+        init_worker(text_idx, date_idx, verbose, cache)
+        yield from map(classify_chunk, chunks)
+        return
+
+    # Spawned, not forked: numba's parallel runtime is not fork-safe once the parent has used it
+    pool_context = multiprocessing.get_context("spawn")
+    with pool_context.Pool(workers, initializer=init_worker, initargs=(text_idx, date_idx, verbose, cache, True)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(classify_chunk, (chunk,)))
+            # Bound the chunks in flight so the input is not read ahead without limit
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def open_output(stack, path, fieldnames, parquet=False):
+    """Open an output file on the stack and return a function writing a list of rows to it
+
+    With parquet=True the rows go to a snappy-compressed Parquet file (all
+    columns as strings) instead of a CSV file.
+    """
+    if parquet:
+        schema = pa.schema([(name, pa.string()) for name in fieldnames])
+        writer = stack.enter_context(pq.ParquetWriter(path, schema, compression='snappy'))
+
+        def write_rows(rows):
+            if rows:
+                columns = [pa.array([row[k] if k < len(row) else None for row in rows], type=pa.string())
+                           for k in range(len(fieldnames))]
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+
+        return write_rows
+
+    f = stack.enter_context(open(path, 'w', encoding='utf-8', newline='', buffering=IO_BUFFER_SIZE))
+    writer = csv.writer(f)
+    writer.writerow(fieldnames)
+    return writer.writerows
+
+
+def process_csv(input_file, output_climate, output_no_climate, mock=False, sample=None, verbose=False,
+                workers=1, arrow=False, cache=True, parquet=False):
+    """Process CSV and filter rows by climate relevance
+
+    Rows are classified in chunks of CHUNK_SIZE across `workers` processes
+    and written back in input order. With arrow=True the input is parsed by
+    pyarrow's multithreaded CSV reader instead of the csv module. With
+    cache=True, repeated texts reuse the match found the first time. With
+    parquet=True both outputs are written as Parquet instead of CSV, which
+    skips per-field quoting and is typically 5-10x smaller.
+    """
+    if (arrow or parquet) and pa is None:
+        raise ImportError("pyarrow is required for arrow=True or parquet=True")
+
+    climate_count = 0
+    no_climate_count = 0
+    matches_report = []
+
+    with ExitStack() as stack:
+        f = stack.enter_context(
+            open(input_file, 'r', encoding='utf-8', newline='', buffering=IO_BUFFER_SIZE))
+        if hasattr(os, 'posix_fadvise'):
+            # Hint the kernel to read ahead aggressively for a sequential scan
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+
+        # Resolve the text/date columns once from the header
+        # (text could be 'Text', 'text', or other; fall back to the first column)
+        text_idx = next((fieldnames.index(key) for key in TEXT_COLUMNS if key in fieldnames), 0)
+        date_idx = next((fieldnames.index(key) for key in ('Date', 'date') if key in fieldnames), -1)
+
+        # Start the input reader before the outputs are truncated
+        skipped = []
+        if arrow:
+            arrow_reader = stack.enter_context(open_arrow_reader(input_file, fieldnames, skipped))
+            chunks = read_chunks_arrow(arrow_reader, sample)
+        else:
+            chunks = read_chunks(reader, sample)
+
+        # Output rows are streamed chunk by chunk as they are classified
+        # (mock mode writes match info, full mode writes actual rows)
+        output_fields = MOCK_CLIMATE_FIELDS if mock else fieldnames
+        write_climate = open_output(stack, output_climate, output_fields, parquet)
+        output_fields = MOCK_NO_CLIMATE_FIELDS if mock else fieldnames
+        write_no_climate = open_output(stack, output_no_climate, output_fields, parquet)
+
+        for results in classify_chunks(chunks, workers, text_idx, date_idx, verbose, cache):
+            climate_rows = []
+            no_climate_rows = []
+            for row_count, row, date, hit, context, preview, all_matches in results:
+                if hit:
+                    climate_count += 1
+
+                    if verbose:
+                        keywords_found, patterns_found = all_matches
+                        print(f"Row {row_count} ({date}): "
+                              f"keywords={[k for k, _ in keywords_found]} "
+                              f"patterns={[p for p, _ in patterns_found]}")
+
+                    matched, pos, match_type = hit
                     matches_report.append({
                         'row': row_count,
                         'date': date,
                         'type': 'climate',
-                        'match_type': 'pattern',
-                        'matched': match,
+                        'match_type': match_type,
+                        'matched': matched,
                         'context': context
                     })
-            else:
-                no_climate_count += 1
-                if mock:
-                    no_climate_rows.append({
-                        'row_num': row_count,
-                        'date': date,
-                        'preview': text[:200]
-                    })
+
+                    if mock:
+                        climate_rows.append([str(row_count), date, matched, match_type, context])
+                    else:
+                        climate_rows.append(row)
                 else:
-                    no_climate_rows.append(row)
-
-    # Write output files (mock mode writes match info, full mode writes actual rows)
-    if mock:
-        # Mock mode: write match summary to CSVs
-        mock_climate_fields = ["RowNumber", "Date", "MatchedKeyword", "MatchType", "Context"]
-        mock_no_climate_fields = ["RowNumber", "Date", "Preview"]
-
-        with open(output_climate, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=mock_climate_fields)
-            writer.writeheader()
-            for match in matches_report:
-                writer.writerow({
-                    "RowNumber": match['row'],
-                    "Date": match['date'],
-                    "MatchedKeyword": match['matched'],
-                    "MatchType": match['match_type'],
-                    "Context": match['context']
-                })
-
-        with open(output_no_climate, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=mock_no_climate_fields)
-            writer.writeheader()
-            for row_info in no_climate_rows:
-                writer.writerow({
-                    "RowNumber": row_info['row_num'],
-                    "Date": row_info['date'],
-                    "Preview": row_info['preview'][:200]
-                })
-    else:
-        # Full mode: write actual CSV rows
-        with open(output_climate, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(climate_rows)
-
-        with open(output_no_climate, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(no_climate_rows)
+                    no_climate_count += 1
+                    if mock:
+                        no_climate_rows.append([str(row_count), date, preview])
+                    else:
+                        no_climate_rows.append(row)
+
+            write_climate(climate_rows)
+            write_no_climate(no_climate_rows)
+
+    if skipped:
+        print(f"Skipped {len(skipped)} row(s) whose field count does not match the header")
 
     return climate_count, no_climate_count, matches_report
 
@@ -301,6 +596,11 @@ def main():
     parser.add_argument("--output-no-climate", "-n", help="Output file for non-climate rows")
     parser.add_argument("--mock", "-m", action="store_true", help="Mock run (test without copying)")
     parser.add_argument("--sample", "-s", type=int, help="Process only first N rows for testing")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print every keyword/pattern match per climate row")
+    parser.add_argument("--arrow", action="store_true", help="Parse the input with pyarrow's multithreaded CSV reader")
+    parser.add_argument("--parquet", action="store_true", help="Write the outputs as snappy-compressed Parquet instead of CSV")
+    parser.add_argument("--no-cache", action="store_true", help="Do not reuse matches of duplicate texts")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
     parser.add_argument("--historical", action="store_true", help="Process historical_regex_cleaned.csv")
     parser.add_argument("--modern", action="store_true", help="Process modern_regex_cleaned.csv")
 
@@ -319,18 +619,30 @@ def main():
     if not args.input:
         parser.error("--input or --historical/--modern required")
 
+    if (args.arrow or args.parquet) and pa is None:
+        parser.error("--arrow/--parquet require pyarrow")
+
     # Auto-generate output paths if not provided and not mock
     if not args.mock and not args.output_climate:
         base = args.input.replace('.csv', '')
         args.output_climate = f"{base}_climate.csv"
         args.output_no_climate = f"{base}_no_climate.csv"
 
+    if args.parquet:
+        args.output_climate = re.sub(r'\.csv$', '.parquet', args.output_climate)
+        args.output_no_climate = re.sub(r'\.csv$', '.parquet', args.output_no_climate)
+
     process_csv(
         args.input,
         args.output_climate,
         args.output_no_climate,
         mock=args.mock,
-        sample=args.sample
+        sample=args.sample,
+        verbose=args.verbose,
+        workers=args.workers,
+        arrow=args.arrow,
+        cache=not args.no_cache,
+        parquet=args.parquet
     )
 
 